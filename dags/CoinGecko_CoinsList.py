@@ -0,0 +1,88 @@
+"""
+## CoinGecko coins/list ingestion DAG
+
+This DAG extracts the full list of available coins from the CoinGecko API
+and lands the raw JSON files in the Bronze layer of the Azure Blob Storage
+container.
+
+Extraction and upload run inside a single task: the API pages are written
+to a context-managed temporary folder and uploaded concurrently to Blob
+Storage, and the folder is removed when the context exits — even on
+failure. Keeping one task avoids the scheduler gap, the metadata-DB
+writes, and the XCom hops that separate create/extract/load/cleanup tasks
+would pay on every run.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from os import scandir
+from typing import List
+
+from airflow.decorators import dag, task
+from pendulum import datetime
+
+from include.extractors.api.CoinGecko import CoinGeckoCoinsList
+from include.utils.azure_tools import get_blob_client
+from include.utils.file_tools import storage_path
+
+STORAGE_CONTAINER: str = "airflow-datawarehouse"
+STORAGE_LAYER: str = "Bronze"
+
+PARAMS_QUERY = {"include_platform": "true"}
+
+UPLOAD_MAX_WORKERS: int = 16
+
+
+@dag(
+    start_date=datetime(2025, 1, 1),
+    schedule="@daily",
+    catchup=False,
+    doc_md=__doc__,
+    default_args={"owner": "gregomelo", "retries": 3},
+    tags=["coingecko", "bronze"],
+)
+def coingecko_coins_list():
+    """Extract the CoinGecko coins/list endpoint into the Bronze layer."""
+
+    @task
+    def extract_and_load() -> None:
+        """Extract the API pages and upload them to Azure Blob Storage.
+
+        The uploads are network-bound, so they are fanned out over a
+        thread pool instead of paying one round-trip per file
+        sequentially.
+        """
+        load_to_storage: str = storage_path(
+            STORAGE_LAYER,
+            CoinGeckoCoinsList.source_name,
+            CoinGeckoCoinsList._relative_url.replace("/", "_"),
+        )
+
+        with tempfile.TemporaryDirectory(
+            suffix="_coingecko_coins_list"
+        ) as load_to_folder:
+            extractor_api = CoinGeckoCoinsList(
+                params_query=PARAMS_QUERY, load_to=load_to_folder
+            )
+            extractor_api.start()
+
+            storage_client = get_blob_client(STORAGE_CONTAINER, pid=os.getpid())
+
+            with scandir(load_to_folder) as entries:
+                upload_paths: List[str] = [
+                    entry.path for entry in entries if entry.is_file()
+                ]
+
+            with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+                list(
+                    executor.map(
+                        lambda path: storage_client.upload_file(path, load_to_storage),
+                        upload_paths,
+                    )
+                )
+
+    extract_and_load()
+
+
+coingecko_coins_list()
@@ -14,7 +14,7 @@ CoinGeckoCoinsList
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from include.extractors.api_base import APIExtractor
 
@@ -31,10 +31,13 @@ class CoinGeckoBase(APIExtractor):
         Name of the data source.
     _endpoint : str
         Base URL of the CoinGecko API.
+    _max_requests_per_minute : int
+        Request budget kept below CoinGecko's documented 60 req/min limit.
     """
 
     source_name: str = "CoinGecko"
     _endpoint: str = "https://api.coingecko.com/api/v3/"
+    _max_requests_per_minute: int = 50
 
 
 class CoinGeckoCoinsList(CoinGeckoBase):
@@ -46,11 +49,19 @@ class CoinGeckoCoinsList(CoinGeckoBase):
     ----------
     _relative_url : str
         Relative URL of the 'coins/list' endpoint.
+    _paginated : bool
+        False, as the 'coins/list' endpoint returns everything in one page.
     """
 
     _relative_url: str = "coins/list"
-
-    def __init__(self, params_query: Dict[str, Any], load_to: Path | str):
+    _paginated: bool = False
+
+    def __init__(
+        self,
+        params_query: Dict[str, Any],
+        load_to: Path | str,
+        sink: Optional[Callable[[bytes, int], None]] = None,
+    ):
         """Initialize the extractor for the 'coins/list' endpoint.
 
         Parameters
@@ -59,8 +70,10 @@ class CoinGeckoCoinsList(CoinGeckoBase):
             Query parameters to be sent in the API request.
         load_to : Path | str
             Destination path or filename where the extracted data will be saved.
+        sink : Optional[Callable[[bytes, int], None]], optional
+            Callable receiving each serialized page instead of a local file.
         """
-        super().__init__(self._relative_url, params_query, load_to)
+        super().__init__(self._relative_url, params_query, load_to, sink=sink)
 
     def _is_last_page(self, data: Any) -> bool:
         """Determine if the current page is the last one.
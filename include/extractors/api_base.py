@@ -6,14 +6,46 @@ for paginated API data extraction. Subclasses must implement pagination logic
 to customize the extraction process.
 """
 
-import json
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
 from urllib.parse import urljoin
 
-from httpx import Client
+import ijson
+import orjson
+import zstandard
+from httpx import Client, HTTPError, HTTPTransport, Limits, Timeout
+
+from include.utils.log_tools import logger
+
+
+class _ByteIteratorReader:
+    """Minimal file-like adapter over an iterator of byte chunks.
+
+    `ijson` expects a `read(size)` interface, while httpx streaming
+    responses expose an iterator of chunks; this bridges the two without
+    buffering more than one chunk beyond the requested size.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` bytes (all remaining bytes if negative)."""
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
 
 
 class APIExtractor(ABC):
@@ -30,16 +62,33 @@ class APIExtractor(ABC):
         Static attribute for the source name (must be defined in subclasses).
     _endpoint : str
         Static attribute for the API endpoint (must be defined in subclasses).
+    _paginated : bool
+        Static attribute; subclasses for non-paginated endpoints set this to
+        False to take the single-request fast path in `_fetch_data`.
+    _max_requests_per_minute : Optional[int]
+        Static attribute; when set, requests are spaced so the API's rate
+        limit is never hit (throttled runs beat throttled-and-retried ones).
     _relative_url : str
         The specific API path for the request.
     source_surname : str
         A sanitized version of `_relative_url` used in filenames.
+    _file_stem : str
+        Precomputed `{source_name}_{source_surname}` filename stem.
+    _full_url : str
+        Precomputed absolute URL of the API endpoint.
     _params_query : Dict
         Query parameters to be sent in the API request.
     _load_to : Path | str
         The target directory for storing extracted data.
     _session : Optional[Client]
         An HTTPX client session for making API requests.
+    _output_path : Optional[Path]
+        Path of the JSON-Lines output file for the current run.
+    _output : Optional[BinaryIO]
+        Open handle to the JSON-Lines output file for the current run.
+    _sink : Optional[Callable[[bytes, int], None]]
+        Optional callable receiving each serialized page instead of the
+        local file (e.g. a direct upload to blob storage).
 
     Notes
     -----
@@ -52,8 +101,16 @@ class APIExtractor(ABC):
 
     source_name: str
     _endpoint: str
-
-    def __init__(self, relative_url: str, params_query: Dict, load_to: Path | str):
+    _paginated: bool = True
+    _max_requests_per_minute: Optional[int] = None
+
+    def __init__(
+        self,
+        relative_url: str,
+        params_query: Dict,
+        load_to: Path | str,
+        sink: Optional[Callable[[bytes, int], None]] = None,
+    ):
         """
         Initialize the API extractor with request parameters and output settings.
 
@@ -65,12 +122,27 @@ class APIExtractor(ABC):
             Dictionary containing default query parameters.
         load_to : Path | str
             Destination path for storing fetched data.
+        sink : Optional[Callable[[bytes, int], None]], optional
+            Callable invoked with each serialized page and its page number.
+            When provided, pages are handed to the sink (e.g. streamed
+            straight to blob storage) and no local file is written.
         """
         self._relative_url: str = relative_url
         self.source_surname: str = relative_url.replace("/", "_")
+        self._file_stem: str = f"{self.source_name}_{self.source_surname}"
+        self._full_url: str = urljoin(self._endpoint, relative_url)
         self._params_query: Dict = params_query
         self._load_to: Path | str = load_to
+        self._sink: Optional[Callable[[bytes, int], None]] = sink
         self._session: Optional[Client] = None
+        self._output_path: Optional[Path] = None
+        self._output: Optional[BinaryIO] = None
+        self._min_request_interval: float = (
+            60.0 / self._max_requests_per_minute
+            if self._max_requests_per_minute
+            else 0.0
+        )
+        self._last_request_at: float = 0.0
 
     def start(self) -> None:
         """
@@ -79,12 +151,15 @@ class APIExtractor(ABC):
         This method initializes an HTTP session, fetches data from the API, and
         stores the results in the specified output location.
 
-        Ensures that the session is properly closed, even if an error occurs.
+        Ensures that the session and the output file are properly closed,
+        even if an error occurs.
         """
         self._open_session()
+        self._open_output()
         try:
             self._fetch_data()
         finally:
+            self._close_output()
             self._close_session()
 
     def _get_headers(self) -> Dict[str, str]:
@@ -102,10 +177,24 @@ class APIExtractor(ABC):
         """
         Open an HTTP session using `httpx.Client`.
 
-        The session is configured with the API endpoint and default headers.
+        The session is configured with default headers, HTTP/2 support,
+        connection pooling, and transport-level retries, and is reused if a
+        previous session is still open. Keeping connections alive avoids one
+        TLS handshake per page on paginated endpoints.
         """
+        if self._session is not None and not self._session.is_closed:
+            return
+
         headers: Dict[str, str] = self._get_headers()
-        self._session = Client(headers=headers)
+        self._session = Client(
+            headers=headers,
+            timeout=Timeout(30.0),
+            transport=HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=Limits(max_keepalive_connections=20, max_connections=50),
+            ),
+        )
 
     def _close_session(self) -> None:
         """
@@ -116,10 +205,63 @@ class APIExtractor(ABC):
         if self._session:
             self._session.close()
 
-    def _get_data(self, **kwargs) -> Optional[Dict]:
+    def _open_output(self) -> None:
+        """
+        Open the JSON-Lines output file for the current run.
+
+        All pages of one run are appended to a single `.jsonl` file instead
+        of one file per page, so downstream tasks handle a single inode and
+        a single blob upload per extraction.
+
+        The stream is zstd-compressed (level 3): raw API JSON is highly
+        repetitive and compresses 5-10x, cutting both disk and upload bytes.
+
+        No file is opened when a sink is configured.
+        """
+        if self._sink is not None:
+            return
+
+        run_ts: str = datetime.now(timezone.utc).strftime("%d-%m-%yT%H_%M_%S")
+        self._output_path = (
+            Path(self._load_to) / f"{self._file_stem}_{run_ts}.jsonl.zst"
+        )
+        # 64 KiB buffer batches small page writes into fewer, larger syscalls
+        self._output = zstandard.ZstdCompressor(level=3).stream_writer(
+            open(self._output_path, "wb", buffering=64 * 1024)
+        )
+
+    def _close_output(self) -> None:
+        """
+        Close the JSON-Lines output file of the current run.
+
+        Ensures that buffered data is flushed to disk.
+        """
+        if self._output:
+            self._output.close()
+            self._output = None
+
+    def _throttle(self) -> None:
+        """
+        Space requests to honor the source's rate limit.
+
+        Sleeps just long enough to keep the request rate below
+        `_max_requests_per_minute`; a no-op when no limit is configured.
+        """
+        if self._min_request_interval:
+            wait = self._min_request_interval - (
+                time.monotonic() - self._last_request_at
+            )
+            if wait > 0:
+                time.sleep(wait)
+        self._last_request_at = time.monotonic()
+
+    def _get_data(self, **kwargs) -> Dict:
         """
         Fetch data from the API with optional pagination parameters.
 
+        Error handling lives at the call site in `_fetch_data` so the
+        per-page happy path stays free of exception scaffolding.
+
         Parameters
         ----------
         **kwargs : dict
@@ -127,14 +269,15 @@ class APIExtractor(ABC):
 
         Returns
         -------
-        Optional[Dict]
-            The JSON response from the API if the request is successful;
-            otherwise, returns `None`.
+        Dict
+            The decoded JSON response from the API.
 
         Raises
         ------
         RuntimeError
             If called before initializing the session.
+        httpx.HTTPError
+            If the request fails or returns an error status.
         """
         if self._session is None:
             raise RuntimeError("Session has not been initialized.")
@@ -142,16 +285,62 @@ class APIExtractor(ABC):
         # Merge static parameters with dynamic pagination parameters
         query_params: Dict = {**self._params_query, **kwargs}
 
-        # Ensure proper URL concatenation
-        full_url = urljoin(self._endpoint, self._relative_url)
+        self._throttle()
+        response = self._session.get(url=self._full_url, params=query_params)
 
-        try:
-            response = self._session.get(url=full_url, params=query_params)
+        if response.status_code == 429:
+            try:
+                retry_after = int(response.headers.get("Retry-After", 60))
+            except ValueError:
+                # RFC 7231 also allows an HTTP-date here; fall back to a
+                # fixed wait instead of crashing on a valid response
+                retry_after = 60
+            logger.warning("Rate limited by the API; retrying in {}s.", retry_after)
+            time.sleep(retry_after)
+            response = self._session.get(url=self._full_url, params=query_params)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _stream_items(self, prefix: str = "item", **kwargs) -> Iterator[Any]:
+        """
+        Stream individual items from the API response as they arrive.
+
+        Unlike `_get_data`, the response body is never fully materialized:
+        items are parsed incrementally with `ijson`, bounding memory at one
+        item regardless of payload size. Intended for subclasses whose
+        endpoints return large arrays.
+
+        Parameters
+        ----------
+        prefix : str
+            The ijson prefix of the items to yield (default top-level array
+            items).
+        **kwargs : dict
+            Additional query parameters (e.g., `page`, `cursor`, `offset`).
+
+        Yields
+        ------
+        Any
+            The parsed items found under `prefix`.
+
+        Raises
+        ------
+        RuntimeError
+            If called before initializing the session.
+        """
+        if self._session is None:
+            raise RuntimeError("Session has not been initialized.")
+
+        query_params: Dict = {**self._params_query, **kwargs}
+
+        self._throttle()
+        with self._session.stream(
+            "GET", self._full_url, params=query_params
+        ) as response:
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+            reader = _ByteIteratorReader(response.iter_bytes(65536))
+            yield from ijson.items(reader, prefix)
 
     @abstractmethod
     def _is_last_page(self, data: Dict) -> bool:
@@ -200,54 +389,76 @@ class APIExtractor(ABC):
         - Requests data from the API.
         - Saves retrieved data to the specified output path.
         - Determines pagination and fetches subsequent pages if necessary.
+
+        Pages are written by a single background worker so the disk write of
+        page N overlaps the HTTP round-trip of page N+1.
+
+        Extractors with `_paginated = False` take a single-request fast path
+        that skips the pagination loop and its per-page dispatch entirely.
         """
+        if not self._paginated:
+            try:
+                data = self._get_data()
+            except HTTPError as e:
+                logger.error("API request failed: {}", e)
+                return
+
+            if data:
+                self._load_data(data, page=1)
+            return
+
         page: int = 1
         pagination_params: Dict[str, Any] = {}  # Empty on first request
+        pending_write: Optional[Future] = None
 
-        while True:
-            data = self._get_data(**pagination_params)
-            if not data:
-                break
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            while True:
+                try:
+                    data = self._get_data(**pagination_params)
+                except HTTPError as e:
+                    logger.error("API request failed: {}", e)
+                    break
 
-            self._load_data(data, self._load_to, page)
+                if not data:
+                    break
 
-            if self._is_last_page(data):
-                break
+                # Surface any error from the previous page before queuing more
+                if pending_write is not None:
+                    pending_write.result()
 
-            # Update pagination parameters for the next request
-            pagination_params = self._get_next_pagination(data)
-            page += 1
+                pending_write = writer.submit(self._load_data, data, page)
 
-    def _load_data(self, data: Dict, load_to: Path | str, page: int) -> None:
-        """
-        Save fetched API data to a file.
+                if self._is_last_page(data):
+                    break
 
-        The filename is dynamically generated based on the source, timestamp,
-        and page number.
+                # Update pagination parameters for the next request
+                pagination_params = self._get_next_pagination(data)
+                page += 1
+
+            if pending_write is not None:
+                pending_write.result()
+
+    def _load_data(self, data: Dict, page: int) -> None:
+        """
+        Append one page of API data to the run's JSON-Lines file.
 
         Parameters
         ----------
         data : Dict
             The JSON data retrieved from the API.
-        load_to : Path | str
-            The destination directory or file path.
         page : int
-            The page number (used for file naming).
+            The page number (unused in the filename, kept for bookkeeping).
 
         Raises
         ------
-        Exception
-            If an error occurs while writing the file.
-        """
-        filename: str = (
-            f"{str(load_to)}/"
-            f"{self.source_name}_"
-            f"{self.source_surname}_"
-            f"{datetime.now(timezone.utc).strftime('%d-%m-%yT%H_%M_%S')}_"
-            f"{page:03d}.json"
-        )
-        try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print(f"Error saving file: {e}")
+        RuntimeError
+            If called before opening the output file and no sink is set.
+        """
+        if self._sink is not None:
+            self._sink(orjson.dumps(data), page)
+            return
+
+        if self._output is None:
+            raise RuntimeError("Output file has not been opened.")
+
+        self._output.write(orjson.dumps(data) + b"\n")
@@ -6,17 +6,128 @@ file uploads, downloads, and listing objects.
 """
 
 import os
-import sys
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from dotenv import load_dotenv
-from loguru import logger
 
-# Load environment variables from a .env file
-load_dotenv()
+from include.utils.env_tools import ensure_dotenv, require_env_vars
+from include.utils.log_tools import logger
+
+
+@cache
+def _load_env_vars() -> Dict[str, str]:
+    """
+    Load and validate required environment variables.
+
+    The result is cached: Airflow re-imports modules and re-instantiates
+    clients frequently, and the environment does not change mid-process.
+
+    Returns
+    -------
+    Dict[str, str]
+        Dictionary containing AWS credentials and region.
+
+    Raises
+    ------
+    SystemExit
+        If any required environment variable is missing.
+    """
+    ensure_dotenv()
+
+    return require_env_vars(
+        {
+            "aws_access_key_id": os.getenv("AWS_ACCESS_KEY_ID", ""),
+            "aws_secret_access_key": os.getenv("AWS_SECRET_ACCESS_KEY", ""),
+            "aws_default_region": os.getenv("AWS_REGION", "us-east-1"),
+        }
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_boto3_s3_client(
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    region_name: str,
+    endpoint_url: Optional[str],
+) -> Any:
+    """
+    Build (or reuse) a boto3 S3 client for the given credentials.
+
+    boto3 client construction loads botocore's JSON service models and sets
+    up a connection pool on every call, so instances created with the same
+    parameters are shared process-wide.
+
+    The pool is sized for concurrent transfers (default 10 connections
+    stalls thread fan-out) and can be tuned via `AWS_S3_POOL`.
+
+    Returns
+    -------
+    Any
+        A cached boto3 S3 client.
+    """
+    return boto3.client(
+        "s3",
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+        endpoint_url=endpoint_url,  # None = Real AWS, LocalStack if set
+        config=Config(
+            max_pool_connections=int(os.getenv("AWS_S3_POOL", "64")),
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(s3_bucket: str, pid: Optional[int] = None) -> "S3Client":
+    """
+    Build (or reuse) an `S3Client` for the given bucket.
+
+    DAG tasks that construct a client per call would otherwise re-run env
+    validation and client construction each time; the cache keeps one
+    instance per bucket for the lifetime of the worker process.
+
+    Parameters
+    ----------
+    s3_bucket : str
+        Name of the S3 bucket to be used.
+    pid : int, optional
+        Pass `os.getpid()` under forking executors: boto3 clients are not
+        fork-safe, and keying on the pid gives each forked worker its own
+        instance instead of a connection pool inherited from the parent.
+
+    Returns
+    -------
+    S3Client
+        A cached client instance for the bucket.
+    """
+    return S3Client(s3_bucket)
+
+
+def _clear_client_caches() -> None:
+    """
+    Drop all cached S3 clients after a fork.
+
+    The pid key on `get_s3_client` gives the child a fresh wrapper, but
+    the boto3 client behind it is cached separately and would still be
+    the parent's instance with its inherited connection pool; clearing
+    both caches makes the first call in the child rebuild everything.
+    """
+    _get_boto3_s3_client.cache_clear()
+    get_s3_client.cache_clear()
+
+
+os.register_at_fork(after_in_child=_clear_client_caches)
 
 
 class S3Client:
@@ -31,60 +142,79 @@ class S3Client:
         s3_bucket : str
             Name of the S3 bucket to be used.
         """
-        self._envs = self._load_env_vars()
+        self._envs = _load_env_vars()
         self._endpoint_url = os.getenv("AWS_S3_ENDPOINT", "").strip() or None
         self.s3_bucket = s3_bucket
 
-        self.s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self._envs["aws_access_key_id"],
-            aws_secret_access_key=self._envs["aws_secret_access_key"],
-            region_name=self._envs["aws_default_region"],
-            endpoint_url=self._endpoint_url,  # None = Real AWS, LocalStack if set
+        self.s3 = _get_boto3_s3_client(
+            self._envs["aws_access_key_id"],
+            self._envs["aws_secret_access_key"],
+            self._envs["aws_default_region"],
+            self._endpoint_url,
+        )
+
+        self._transfer_config = TransferConfig(
+            multipart_threshold=int(
+                os.getenv("AWS_S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))
+            ),
+            multipart_chunksize=int(
+                os.getenv("AWS_S3_MULTIPART_CHUNKSIZE", str(16 * 1024 * 1024))
+            ),
+            max_concurrency=int(os.getenv("AWS_S3_MAX_CONCURRENCY", "16")),
+            use_threads=True,
         )
 
-    @staticmethod
-    def _load_env_vars() -> Dict[str, str]:
+    def upload_file(self, upload_file_path: Union[str, Path], load_folder: str) -> bool:
         """
-        Load and validate required environment variables.
+        Upload a file to S3.
+
+        Parameters
+        ----------
+        upload_file_path : Union[str, Path]
+            Path of the file to be uploaded.
+        load_folder : str
+            Destination folder in S3 where the file will be stored.
 
         Returns
         -------
-        Dict[str, str]
-            Dictionary containing AWS credentials and region.
-
-        Raises
-        ------
-        SystemExit
-            If any required environment variable is missing.
+        bool
+            True if upload succeeds, False otherwise.
         """
-        required_vars: Dict[str, str] = {
-            "aws_access_key_id": os.getenv("AWS_ACCESS_KEY_ID", ""),
-            "aws_secret_access_key": os.getenv("AWS_SECRET_ACCESS_KEY", ""),
-            "aws_default_region": os.getenv("AWS_REGION", "us-east-1"),
-        }
-
-        missing_vars: List[str] = [
-            key for key, value in required_vars.items() if not value
-        ]
-        if missing_vars:
+        try:
+            filename: str = Path(upload_file_path).name
+            s3_key: str = f"{load_folder}/{filename}"
+            self.s3.upload_file(
+                Filename=str(upload_file_path),
+                Bucket=self.s3_bucket,
+                Key=s3_key,
+                Config=self._transfer_config,
+            )
+            return True
+        except NoCredentialsError:
             logger.error(
-                f"Missing required environment variables: {', '.join(missing_vars)}"
+                "AWS credentials not found. "
+                "Check your environment variables or AWS config."
             )
-            sys.exit(1)
-
-        return required_vars
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("S3 upload failed: {}", e)
+        return False
 
-    def upload_file(self, upload_file_path: Union[str, Path], load_folder: str) -> bool:
+    def upload_fileobj(self, data: BinaryIO, load_folder: str, filename: str) -> bool:
         """
-        Upload a file to S3.
+        Upload a file-like object to S3 without copying it into memory.
+
+        The stream is handed directly to boto3's managed transfer, so no
+        intermediate bytes copy is made and large payloads go through the
+        same multipart path as on-disk files.
 
         Parameters
         ----------
-        upload_file_path : Union[str, Path]
-            Path of the file to be uploaded.
+        data : BinaryIO
+            A readable binary stream positioned anywhere (it is rewound).
         load_folder : str
-            Destination folder in S3 where the file will be stored.
+            Destination folder in S3 where the object will be stored.
+        filename : str
+            The object name to create under `load_folder`.
 
         Returns
         -------
@@ -92,20 +222,81 @@ class S3Client:
             True if upload succeeds, False otherwise.
         """
         try:
-            filename: str = Path(upload_file_path).name
             s3_key: str = f"{load_folder}/{filename}"
-            with open(file=upload_file_path, mode="rb") as data:
-                self.s3.put_object(Body=data, Bucket=self.s3_bucket, Key=s3_key)
+            data.seek(0)
+            self.s3.upload_fileobj(
+                data,
+                self.s3_bucket,
+                s3_key,
+                Config=self._transfer_config,
+            )
             return True
         except NoCredentialsError:
             logger.error(
                 "AWS credentials not found. "
                 "Check your environment variables or AWS config."
             )
-        except ClientError as e:
-            logger.error(f"S3 upload failed: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("S3 upload failed: {}", e)
         return False
 
+    def upload_many(
+        self,
+        upload_file_paths: Iterable[Union[str, Path]],
+        load_folder: str,
+        max_workers: int = 16,
+    ) -> List[bool]:
+        """
+        Upload several files to S3 concurrently.
+
+        Uploads are network-bound and independent, so they are fanned out
+        over a thread pool sharing this client's connection pool instead of
+        paying one round-trip per file sequentially.
+
+        Parameters
+        ----------
+        upload_file_paths : Iterable[Union[str, Path]]
+            Paths of the files to be uploaded.
+        load_folder : str
+            Destination folder in S3 where the files will be stored.
+        max_workers : int
+            Number of concurrent uploads (default 16).
+
+        Returns
+        -------
+        List[bool]
+            One result per file, in input order: True on success.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda path: self.upload_file(path, load_folder),
+                    upload_file_paths,
+                )
+            )
+
+    def download_many(
+        self, s3_keys: Iterable[str], max_workers: int = 16
+    ) -> List[Optional[bytes]]:
+        """
+        Download several objects from S3 concurrently.
+
+        Parameters
+        ----------
+        s3_keys : Iterable[str]
+            The S3 object keys to download.
+        max_workers : int
+            Number of concurrent downloads (default 16).
+
+        Returns
+        -------
+        List[Optional[bytes]]
+            One result per key, in input order: the object content, or
+            None for keys that failed.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.download_file, s3_keys))
+
     def download_file(
         self, s3_key: str, local_path: Optional[str] = None
     ) -> Optional[bytes]:
@@ -126,7 +317,13 @@ class S3Client:
         """
         try:
             response = self.s3.get_object(Bucket=self.s3_bucket, Key=s3_key)
-            file_content = response["Body"].read()
+            body = response["Body"]
+            try:
+                file_content = body.read()
+            finally:
+                # Release the pooled HTTP connection immediately instead of
+                # holding it checked out until the StreamingBody is GC'd
+                body.close()
 
             if local_path:
                 with open(file=local_path, mode="wb") as download_file:
@@ -141,16 +338,126 @@ class S3Client:
             )
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
-                logger.error(f"File not found in S3: {s3_key}")
+                logger.error("File not found in S3: {}", s3_key)
             else:
-                logger.error(f"S3 download failed: {e}")
+                logger.error("S3 download failed: {}", e)
+
+        return None
+
+    def download_file_bytes(
+        self,
+        s3_key: str,
+        part_size: int = 16 * 1024 * 1024,
+        max_concurrency: int = 8,
+    ) -> Optional[bytes]:
+        """
+        Download an object by fetching aligned byte ranges in parallel.
+
+        A single GET is capped by one connection's bandwidth; objects larger
+        than `part_size` are split into ranged GETs fetched concurrently and
+        written into disjoint slices of one preallocated buffer.
+
+        Parameters
+        ----------
+        s3_key : str
+            The S3 object key (path in S3).
+        part_size : int
+            Size of each ranged GET in bytes (default 16 MiB).
+        max_concurrency : int
+            Number of ranges fetched in parallel.
 
+        Returns
+        -------
+        Optional[bytes]
+            The full object content if successful, None otherwise.
+        """
+        try:
+            size: int = self.s3.head_object(Bucket=self.s3_bucket, Key=s3_key)[
+                "ContentLength"
+            ]
+
+            if size <= part_size:
+                return self.download_file(s3_key)
+
+            buffer = bytearray(size)
+
+            def fetch_range(offset: int) -> None:
+                end = min(offset + part_size, size) - 1
+                response = self.s3.get_object(
+                    Bucket=self.s3_bucket,
+                    Key=s3_key,
+                    Range=f"bytes={offset}-{end}",
+                )
+                body = response["Body"]
+                try:
+                    # Disjoint slices, so no locking is needed between workers
+                    buffer[offset : end + 1] = body.read()
+                finally:
+                    body.close()
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                list(executor.map(fetch_range, range(0, size, part_size)))
+
+            return bytes(buffer)
+        except NoCredentialsError:
+            logger.error(
+                "AWS credentials not found. "
+                "Check your environment variables or AWS config."
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                logger.error("File not found in S3: {}", s3_key)
+            else:
+                logger.error("S3 download failed: {}", e)
         return None
 
+    def iter_objects(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate objects in S3 under a specific prefix.
+
+        Pages come from the list_objects_v2 paginator, fetched by a
+        background thread into a bounded queue, so the next round-trip
+        overlaps the caller's processing of the current page while memory
+        stays capped at a couple of pages.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix to filter objects in the bucket.
+
+        Yields
+        ------
+        Dict[str, Any]
+            Dictionaries containing S3 object metadata.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=2)
+
+        def prefetch() -> None:
+            try:
+                paginator = self.s3.get_paginator("list_objects_v2")
+                for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix):
+                    pages.put(page.get("Contents", []))
+                pages.put(None)  # Sentinel: end of listing
+            except Exception as e:  # Re-raised in the consuming thread
+                pages.put(e)
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+        while True:
+            page = pages.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+
     def list_objects(self, prefix: str) -> List[Dict[str, Any]]:
         """
         List objects in S3 under a specific prefix.
 
+        Unlike a single list_objects_v2 call, this follows continuation
+        tokens, so prefixes with more than 1000 keys are returned in full.
+
         Parameters
         ----------
         prefix : str
@@ -163,15 +470,12 @@ class S3Client:
             Returns an empty list if no objects are found.
         """
         try:
-            response = self.s3.list_objects_v2(Bucket=self.s3_bucket, Prefix=prefix)
-            if "Contents" in response:
-                return response["Contents"]
-            return []
+            return list(self.iter_objects(prefix))
         except NoCredentialsError:
             logger.error(
                 "AWS credentials not found. "
                 "Check your environment variables or AWS config."
             )
         except ClientError as e:
-            logger.error(f"S3 list objects failed: {e}")
+            logger.error("S3 list objects failed: {}", e)
         return []
@@ -6,17 +6,133 @@ including file uploads, downloads, and listing objects.
 """
 
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from azure.core.exceptions import AzureError, ClientAuthenticationError
-from azure.storage.blob import BlobServiceClient
-from dotenv import load_dotenv
-from loguru import logger
+from azure.storage.blob import BlobServiceClient, ContentSettings
 
-# Load environment variables from a .env file
-load_dotenv()
+from include.utils.env_tools import ensure_dotenv, require_env_vars
+from include.utils.log_tools import logger
+
+
+@cache
+def _load_env_vars() -> Dict[str, str]:
+    """
+    Load and validate required environment variables.
+
+    The result is cached: Airflow re-imports modules and re-instantiates
+    clients frequently, and the environment does not change mid-process.
+
+    Returns
+    -------
+    Dict[str, str]
+        A dictionary containing the required Azure Blob Storage credentials.
+
+    Raises
+    ------
+    SystemExit
+        If any required environment variable is missing.
+    """
+    ensure_dotenv()
+
+    return require_env_vars(
+        {
+            "azure_storage_connection_string": os.getenv(
+                "AZURE_STORAGE_CONNECTION_STRING", ""
+            )
+        }
+    )
+
+
+def _blob_upload_concurrency() -> int:
+    """
+    Return the number of parallel block uploads per blob.
+
+    Tunable via `AZURE_BLOB_CONCURRENCY` (default 16).
+    """
+    return int(os.getenv("AZURE_BLOB_CONCURRENCY", "16"))
+
+
+@lru_cache(maxsize=4)
+def _get_blob_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Build (or reuse) a `BlobServiceClient` for the given connection string.
+
+    Creating a service client parses the connection string and compiles the
+    SDK's pipeline policies, so instances are shared process-wide and their
+    underlying connection pool is reused across tasks.
+
+    The default ExponentialRetry can wait ~90s cumulatively before
+    surfacing a transient error, which every Airflow task retry pays on
+    top of its own backoff; retries are kept short here and the outer
+    retry loop belongs to the DAG. `AZURE_RETRY_TOTAL` tunes the attempt
+    count.
+
+    Returns
+    -------
+    BlobServiceClient
+        A cached Blob service client.
+    """
+    return BlobServiceClient.from_connection_string(
+        conn_str=connection_string,
+        retry_total=int(os.getenv("AZURE_RETRY_TOTAL", "3")),
+        retry_backoff_factor=0.8,
+        retry_backoff_max=10,
+        connection_timeout=10,
+        read_timeout=60,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_blob_client(
+    blob_container: str, pid: Optional[int] = None
+) -> "AzureBlobClient":
+    """
+    Build (or reuse) an `AzureBlobClient` for the given container.
+
+    DAG tasks that construct a client per call would otherwise re-run env
+    validation and re-resolve the service client each time; the cache keeps
+    one instance per container for the lifetime of the worker process, so
+    the SDK's connection pool stays warm across uploads.
+
+    Parameters
+    ----------
+    blob_container : str
+        Name of the Azure Blob Storage container to be used.
+    pid : int, optional
+        Pass `os.getpid()` under forking executors: the SDK's pooled
+        sockets must not be shared across a fork, and keying on the pid
+        gives each forked worker its own instance.
+
+    Returns
+    -------
+    AzureBlobClient
+        A cached client instance for the container.
+    """
+    return AzureBlobClient(blob_container)
+
+
+def _clear_client_caches() -> None:
+    """
+    Drop all cached Blob clients after a fork.
+
+    The pid key on `get_blob_client` gives the child a fresh wrapper,
+    but the service client behind it is cached separately and would
+    still be the parent's instance with its inherited pooled sockets;
+    clearing both caches makes the first call in the child rebuild
+    everything.
+    """
+    _get_blob_service_client.cache_clear()
+    get_blob_client.cache_clear()
+
+
+os.register_at_fork(after_in_child=_clear_client_caches)
 
 
 class AzureBlobClient:
@@ -31,51 +147,45 @@ class AzureBlobClient:
         blob_container : str
             Name of the Azure Blob Storage container to be used.
         """
-        self._envs = self._load_env_vars()
+        self._envs = _load_env_vars()
         self.blob_container = blob_container
 
         try:
-            self._blob_service_client = BlobServiceClient.from_connection_string(
-                conn_str=self._envs["azure_storage_connection_string"]
+            self._blob_service_client = _get_blob_service_client(
+                self._envs["azure_storage_connection_string"]
             )
+            self._container_client = self._blob_service_client.get_container_client(
+                blob_container
+            )
+            # Per-blob clients rebuild the SDK pipeline and re-parse the URL
+            # on every get_blob_client call, so they are cached per path
+            self._blob_clients: Dict[str, Any] = {}
         except ClientAuthenticationError:
             logger.error("Authentication failed. Check your Azure Storage credentials.")
             sys.exit(1)
         except AzureError as e:
-            logger.error(f"Failed to initialize Azure Blob client: {e}")
+            logger.error("Failed to initialize Azure Blob client: {}", e)
             sys.exit(1)
 
-    @staticmethod
-    def _load_env_vars() -> Dict[str, str]:
+    def _blob(self, blob_path: str) -> Any:
         """
-        Load and validate required environment variables.
+        Return a cached `BlobClient` for the given blob path.
+
+        Parameters
+        ----------
+        blob_path : str
+            The path of the blob within the container.
 
         Returns
         -------
-        Dict[str, str]
-            A dictionary containing the required Azure Blob Storage credentials.
-
-        Raises
-        ------
-        SystemExit
-            If any required environment variable is missing.
+        Any
+            A cached blob client bound to `blob_path`.
         """
-        required_vars: Dict[str, str] = {
-            "azure_storage_connection_string": os.getenv(
-                "AZURE_STORAGE_CONNECTION_STRING", ""
-            )
-        }
-
-        missing_vars: List[str] = [
-            key for key, value in required_vars.items() if not value
-        ]
-        if missing_vars:
-            logger.error(
-                f"Missing required environment variables: {', '.join(missing_vars)}"
-            )
-            sys.exit(1)
-
-        return required_vars
+        blob_client = self._blob_clients.get(blob_path)
+        if blob_client is None:
+            blob_client = self._container_client.get_blob_client(blob_path)
+            self._blob_clients[blob_path] = blob_client
+        return blob_client
 
     def upload_file(self, upload_file_path: Union[str, Path], load_folder: str) -> bool:
         """
@@ -96,22 +206,129 @@ class AzureBlobClient:
         try:
             filename: str = Path(upload_file_path).name
             blob_path: str = f"{load_folder}/{filename}"
-            blob_client = self._blob_service_client.get_blob_client(
-                container=self.blob_container, blob=blob_path
-            )
+            blob_client = self._blob(blob_path)
+
+            content_settings: Optional[ContentSettings] = None
+            if filename.endswith(".zst"):
+                content_settings = ContentSettings(
+                    content_type="application/json", content_encoding="zstd"
+                )
+
+            # The size hint lets the SDK pick single-put vs staged blocks
+            # upfront instead of buffering the stream to find out
+            size: int = os.path.getsize(upload_file_path)
 
             with open(upload_file_path, "rb") as data:
-                blob_client.upload_blob(data, overwrite=True)
+                blob_client.upload_blob(
+                    data,
+                    overwrite=True,
+                    length=size,
+                    max_concurrency=_blob_upload_concurrency(),
+                    content_settings=content_settings,
+                )
 
             return True
         except FileNotFoundError:
-            logger.error(f"File not found: {upload_file_path}")
+            logger.error("File not found: {}", upload_file_path)
         except ClientAuthenticationError:
             logger.error("Authentication failed. Check your Azure credentials.")
         except AzureError as e:
-            logger.error(f"Azure Blob upload failed: {e}")
+            logger.error("Azure Blob upload failed: {}", e)
         return False
 
+    def upload_bytes(self, data: bytes, load_folder: str, filename: str) -> bool:
+        """
+        Upload an in-memory payload to Azure Blob Storage.
+
+        Avoids the local temp-file round-trip for callers that already hold
+        the payload in memory (e.g. extractor sinks).
+
+        Parameters
+        ----------
+        data : bytes
+            The payload to be uploaded.
+        load_folder : str
+            The destination folder in Azure Blob Storage.
+        filename : str
+            The blob name to create under `load_folder`.
+
+        Returns
+        -------
+        bool
+            True if the upload is successful, False otherwise.
+        """
+        try:
+            blob_path: str = f"{load_folder}/{filename}"
+            blob_client = self._blob(blob_path)
+
+            blob_client.upload_blob(
+                data, overwrite=True, max_concurrency=_blob_upload_concurrency()
+            )
+
+            return True
+        except ClientAuthenticationError:
+            logger.error("Authentication failed. Check your Azure credentials.")
+        except AzureError as e:
+            logger.error("Azure Blob upload failed: {}", e)
+        return False
+
+    def upload_many(
+        self,
+        upload_file_paths: Iterable[Union[str, Path]],
+        load_folder: str,
+        max_workers: int = 16,
+    ) -> List[bool]:
+        """
+        Upload several files to Azure Blob Storage concurrently.
+
+        Uploads are network-bound and independent, so they are fanned out
+        over a thread pool sharing this client's connection pool instead of
+        paying one round-trip per file sequentially.
+
+        Parameters
+        ----------
+        upload_file_paths : Iterable[Union[str, Path]]
+            The local file paths of the files to be uploaded.
+        load_folder : str
+            The destination folder in Azure Blob Storage.
+        max_workers : int
+            Number of concurrent uploads (default 16).
+
+        Returns
+        -------
+        List[bool]
+            One result per file, in input order: True on success.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda path: self.upload_file(path, load_folder),
+                    upload_file_paths,
+                )
+            )
+
+    def download_many(
+        self, blob_paths: Iterable[str], max_workers: int = 16
+    ) -> List[Optional[bytes]]:
+        """
+        Download several blobs from Azure Blob Storage concurrently.
+
+        Parameters
+        ----------
+        blob_paths : Iterable[str]
+            The paths of the blobs to download.
+        max_workers : int
+            Number of concurrent downloads (default 16).
+
+        Returns
+        -------
+        List[Optional[bytes]]
+            One result per blob, in input order: the blob content, or
+            None for blobs that failed.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.download_file, blob_paths))
+
     def download_file(
         self, blob_path: str, local_path: Optional[str] = None
     ) -> Optional[bytes]:
@@ -124,31 +341,71 @@ class AzureBlobClient:
             The path of the file in Azure Blob Storage.
         local_path : str, optional
             The local file path where the downloaded file should be saved.
-            If None, the file content is returned as bytes.
+            When set, chunks are streamed straight to disk as they arrive
+            (O(chunk) resident memory instead of O(blob)) and None is
+            returned. If None, the file content is returned as bytes.
 
         Returns
         -------
         Optional[bytes]
-            The file content in bytes if successful, or None if an error occurs.
+            The file content in bytes when no `local_path` is given, or
+            None when streaming to disk or if an error occurs.
         """
         try:
-            blob_client = self._blob_service_client.get_blob_client(
-                container=self.blob_container, blob=blob_path
-            )
-
-            download_stream = blob_client.download_blob().readall()
+            blob_client = self._blob(blob_path)
 
             if local_path:
                 with open(local_path, "wb") as download_file:
-                    download_file.write(download_stream)
+                    blob_client.download_blob(max_concurrency=8).readinto(download_file)
+                return None
 
-            return download_stream
+            return blob_client.download_blob().readall()
         except ClientAuthenticationError:
             logger.error("Authentication failed. Check your Azure credentials.")
         except AzureError as e:
-            logger.error(f"Azure Blob download failed: {e}")
+            logger.error("Azure Blob download failed: {}", e)
         return None
 
+    def iter_objects(self, prefix: str) -> Iterator[Dict[str, str]]:
+        """
+        Lazily iterate blobs in Azure Blob Storage under a specific prefix.
+
+        Pages come from the list_blobs paged iterator, fetched by a
+        background thread into a bounded queue, so the next round-trip
+        overlaps the caller's processing of the current page while memory
+        stays capped at a couple of pages.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix used to filter objects in the container.
+
+        Yields
+        ------
+        Dict[str, str]
+            Metadata of the found blob objects.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=2)
+
+        def prefetch() -> None:
+            try:
+                blobs = self._container_client.list_blobs(name_starts_with=prefix)
+                for page in blobs.by_page():
+                    pages.put(list(page))
+                pages.put(None)  # Sentinel: end of listing
+            except Exception as e:  # Re-raised in the consuming thread
+                pages.put(e)
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+        while True:
+            page = pages.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield from page
+
     def list_objects(self, prefix: str) -> List[Dict[str, str]]:
         """
         List objects in Azure Blob Storage under a specific prefix.
@@ -165,16 +422,9 @@ class AzureBlobClient:
             Returns an empty list if no objects match the prefix.
         """
         try:
-            container_client = self._blob_service_client.get_container_client(
-                self.blob_container
-            )
-            blobs = container_client.list_blobs(name_starts_with=prefix)
-
-            object_list = list(blobs)
-
-            return object_list
+            return list(self.iter_objects(prefix))
         except ClientAuthenticationError:
             logger.error("Authentication failed. Check your Azure credentials.")
         except AzureError as e:
-            logger.error(f"Azure Blob list operation failed: {e}")
+            logger.error("Azure Blob list operation failed: {}", e)
         return []
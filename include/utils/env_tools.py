@@ -0,0 +1,60 @@
+"""
+Module for handling environment variables.
+
+This module centralizes validation of required environment variables so
+the storage clients do not each carry their own copy of the check.
+"""
+
+import os
+import sys
+from functools import cache
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+from include.utils.log_tools import logger
+
+
+@cache
+def ensure_dotenv() -> None:
+    """
+    Load the `.env` file at most once per process.
+
+    Module-level `load_dotenv()` calls walk the filesystem and re-parse
+    `.env` on every import, and Airflow's DagBag re-imports modules
+    frequently. The load is skipped entirely when credentials are already
+    present in the environment (the usual case on deployed workers).
+    """
+    if not os.getenv("AWS_ACCESS_KEY_ID") and not os.getenv(
+        "AZURE_STORAGE_CONNECTION_STRING"
+    ):
+        load_dotenv()
+
+
+def require_env_vars(required_vars: Dict[str, str]) -> Dict[str, str]:
+    """
+    Validate that every required environment variable has a value.
+
+    Parameters
+    ----------
+    required_vars : Dict[str, str]
+        Mapping of variable name to the value read from the environment.
+
+    Returns
+    -------
+    Dict[str, str]
+        The same mapping, returned unchanged when every value is set.
+
+    Raises
+    ------
+    SystemExit
+        If any required environment variable is missing.
+    """
+    missing_vars: List[str] = [key for key, value in required_vars.items() if not value]
+    if missing_vars:
+        logger.error(
+            "Missing required environment variables: {}", ", ".join(missing_vars)
+        )
+        sys.exit(1)
+
+    return required_vars
@@ -5,12 +5,62 @@ This module provides functions to create and delete temporary directories
 using the `tempfile.TemporaryDirectory` class.
 """
 
-from os import listdir
+from functools import lru_cache
+from os import DirEntry, scandir
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List, Union
+from typing import Callable, Iterator, Union
 
-from loguru import logger
+from include.utils.log_tools import logger
+
+
+@lru_cache(maxsize=4096)
+def storage_path(layer: str, source_name: str, source_surname: str) -> str:
+    """
+    Build the storage key prefix for a source within a lakehouse layer.
+
+    The cache makes repeat calls with the same tuple (the common case in
+    per-file loops) a dict lookup instead of a string format.
+
+    Parameters
+    ----------
+    layer : str
+        The lakehouse layer (e.g. "Bronze").
+    source_name : str
+        Name of the data source (e.g. "CoinGecko").
+    source_surname : str
+        Identifier of the dataset within the source (e.g. "coins_list").
+
+    Returns
+    -------
+    str
+        The storage key prefix `layer/source_name/source_surname`.
+    """
+    return f"{layer}/{source_name}/{source_surname}"
+
+
+def make_storage_prefix(layer: str, source_name: str) -> Callable[[str], str]:
+    """
+    Pre-bind the layer/source part of a storage key for hot loops.
+
+    Computes the shared `layer/source_name/` prefix once so callers that
+    build many keys pay one concatenation per key instead of a full
+    three-field format.
+
+    Parameters
+    ----------
+    layer : str
+        The lakehouse layer (e.g. "Bronze").
+    source_name : str
+        Name of the data source (e.g. "CoinGecko").
+
+    Returns
+    -------
+    Callable[[str], str]
+        A function mapping a source surname to its full storage key.
+    """
+    prefix = f"{layer}/{source_name}/"
+    return lambda source_surname: prefix + source_surname
 
 
 def create_temp_folder(temp_name: str) -> TemporaryDirectory:
@@ -29,7 +79,7 @@ def create_temp_folder(temp_name: str) -> TemporaryDirectory:
     """
     temp_folder = TemporaryDirectory(suffix=f"_{temp_name}")
 
-    logger.info(f"Create temporary folder {temp_folder.name}")
+    logger.info("Create temporary folder {}", temp_folder.name)
 
     return temp_folder
 
@@ -47,26 +97,52 @@ def delete_temp_folder(temp_folder: TemporaryDirectory) -> None:
         The temporary directory instance to be deleted.
     """
     temp_folder.cleanup()
-    logger.info(f"Remove temporary folder {temp_folder.name}")
+    logger.info("Remove temporary folder {}", temp_folder.name)
 
 
-def list_temp_folder(temp_folder: Union[TemporaryDirectory, Path]) -> List[str]:
+def list_temp_folder(temp_folder: Union[TemporaryDirectory, Path]) -> Iterator[str]:
     """
-    List files in a temporary directory.
+    Lazily list file names in a temporary directory.
 
-    This function lists all files in a temporary directory.
+    Names are yielded as `os.scandir` walks the directory, so large
+    folders are consumed without materializing the whole listing first.
 
     Parameters
     ----------
     temp_folder : Union[TemporaryDirectory, Path]
         The temporary directory instance or a Path object.
 
-    Returns
-    -------
-    listdir : List[str]
-        A list with all files in the directory.
+    Yields
+    ------
+    str
+        The name of each entry in the directory.
+    """
+    with scandir(str(temp_folder)) as entries:  # Ensure it's a string path
+        yield from (entry.name for entry in entries)
+
+
+def list_temp_folder_entries(
+    temp_folder: Union[TemporaryDirectory, Path],
+) -> Iterator[DirEntry]:
+    """
+    Lazily list directory entries in a temporary directory.
+
+    Unlike `list_temp_folder`, the yielded `os.DirEntry` objects carry the
+    full path and cached stat information, so callers that need file types
+    or sizes avoid one stat call per entry.
+
+    Parameters
+    ----------
+    temp_folder : Union[TemporaryDirectory, Path]
+        The temporary directory instance or a Path object.
+
+    Yields
+    ------
+    os.DirEntry
+        Each entry in the directory.
     """
-    return listdir(str(temp_folder))  # Ensure it's a string path
+    with scandir(str(temp_folder)) as entries:
+        yield from entries
 
 
 if __name__ == "__main__":
@@ -74,6 +150,6 @@ if __name__ == "__main__":
 
     input("Press Enter to delete the temporary folder...")
 
-    print(list_temp_folder(my_temp_folder))
+    print(list(list_temp_folder(my_temp_folder)))
 
     delete_temp_folder(my_temp_folder)
@@ -0,0 +1,26 @@
+"""
+Module for central logging configuration.
+
+This module configures a single loguru sink for the whole project and
+re-exports the `logger` instance the other modules import.
+"""
+
+import os
+import sys
+
+from loguru import logger
+
+# One sink for the whole process: enqueue=True hands records to loguru's
+# background thread, so hot loops (per-file uploads, listings) never block
+# on formatting or I/O, and the level gate drops records before any
+# formatting work happens. Arguments passed separately to the log call
+# (logger.info("... {}", key)) are only interpolated for records that pass
+# the gate.
+logger.remove()
+logger.add(
+    sys.stderr,
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    enqueue=True,
+)
+
+__all__ = ["logger"]
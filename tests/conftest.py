@@ -0,0 +1,152 @@
+"""
+Shared pytest fixtures.
+
+Expensive mock backends and credential setup live here at session scope:
+entering moto and constructing boto3 clients is dominated by endpoint
+resolution and credential-chain setup, so doing it once per session
+instead of once per test keeps the suite fast. Per-test isolation is
+handled by cheap cleanup fixtures next to the tests that need it.
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Generator
+
+import pytest
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+    from include.utils.azure_tools import AzureBlobClient
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fake_cloud_env() -> Generator[None, None, None]:
+    """
+    Freeze dummy AWS and Azure credentials for the whole session.
+
+    One autouse fixture instead of per-test credential fixtures: the
+    environment is snapshotted and mutated once at session start and
+    restored wholesale at the end — no monkeypatch undo-stack
+    bookkeeping per variable — and fake credentials being the default
+    also guards every test against accidentally reaching real cloud
+    endpoints.
+    """
+    original = os.environ.copy()
+    os.environ.update(
+        {
+            "AWS_ACCESS_KEY_ID": "test",
+            "AWS_SECRET_ACCESS_KEY": "test",
+            "AWS_REGION": "us-east-1",
+            "AZURE_STORAGE_CONNECTION_STRING": (
+                "DefaultEndpointsProtocol=https;AccountName=test;"
+                "AccountKey=test;EndpointSuffix=core.windows.net"
+            ),
+        }
+    )
+    os.environ.pop("AWS_S3_ENDPOINT", None)
+    yield
+    os.environ.clear()
+    os.environ.update(original)
+
+
+@pytest.fixture(scope="session")
+def boto_session() -> "boto3.session.Session":
+    """
+    Share one boto3 Session across the whole test session.
+
+    Session construction loads botocore's data files and resolves the
+    credential chain; clients derived from a shared session skip that
+    work. boto3 is imported here, not at module top, so collecting
+    unrelated tests skips the SDK import.
+
+    Returns
+    -------
+    boto3.session.Session
+        The shared session.
+    """
+    # moto hooks into botocore's BUILTIN_HANDLERS at import time, so it
+    # must be imported before the Session is built for mocking to attach
+    import boto3
+    import moto  # noqa: F401
+
+    return boto3.session.Session()
+
+
+@pytest.fixture(scope="session")
+def boto_config() -> "Config":
+    """
+    Botocore config tuned for tests: no retries, fast timeouts.
+
+    Returns
+    -------
+    Config
+        The shared client config.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=50,
+        retries={"max_attempts": 1},
+        connect_timeout=1,
+        read_timeout=5,
+    )
+
+
+@pytest.fixture(scope="session")
+def s3_mock(
+    boto_session: "boto3.session.Session",
+    boto_config: "Config",
+) -> Generator[Any, None, None]:
+    """
+    Start the moto AWS mock for S3 once per session.
+
+    Yields
+    ------
+    boto3.client
+        Mocked S3 client derived from the shared session.
+    """
+    from moto import mock_aws
+
+    with mock_aws():
+        yield boto_session.client("s3", region_name="us-east-1", config=boto_config)
+
+
+@pytest.fixture
+def azure_client(mocker) -> "AzureBlobClient":
+    """
+    Create an instance of AzureBlobClient using a mocked Azure service.
+
+    The dummy connection string comes from the session-wide
+    ``_fake_cloud_env`` fixture.
+
+    Parameters
+    ----------
+    mocker : pytest-mock.MockerFixture
+        Fixture for creating mocks.
+
+    Returns
+    -------
+    AzureBlobClient
+        Instance of AzureBlobClient for testing.
+    """
+    from include.utils.azure_tools import AzureBlobClient, _get_blob_service_client
+
+    # The service-client factory is lru_cached, so without a clear the
+    # patched from_connection_string below is never consulted after the
+    # first test and every client reuses the first mock
+    _get_blob_service_client.cache_clear()
+
+    # No spec=BlobServiceClient: the tests only call get_container_client /
+    # get_blob_client, and spec'ing walks the SDK class via dir() on every
+    # fixture construction
+    mock_container_client = mocker.Mock()
+    mock_blob_service_client = mocker.MagicMock()
+    mock_blob_service_client.get_container_client.return_value = mock_container_client
+
+    mocker.patch(
+        "include.utils.azure_tools.BlobServiceClient.from_connection_string",
+        return_value=mock_blob_service_client,
+    )
+
+    return AzureBlobClient(blob_container="test-container")
@@ -3,6 +3,7 @@
 import os
 import logging
 from contextlib import contextmanager
+from functools import cache
 import pytest
 from airflow.models import DagBag
 
@@ -18,28 +19,35 @@ def suppress_logging(namespace):
         logger.disabled = old_value
 
 
+@cache
+def get_dag_bag():
+    """
+    Build the DagBag once; it parses every DAG file, so callers share it
+    """
+    with suppress_logging("airflow"):
+        return DagBag(include_examples=False)
+
+
 def get_import_errors():
     """
     Generate a tuple for import errors in the dag bag
     """
-    with suppress_logging("airflow"):
-        dag_bag = DagBag(include_examples=False)
+    dag_bag = get_dag_bag()
 
-        def strip_path_prefix(path):
-            return os.path.relpath(path, os.environ.get("AIRFLOW_HOME"))
+    def strip_path_prefix(path):
+        return os.path.relpath(path, os.environ.get("AIRFLOW_HOME"))
 
-        # prepend "(None,None)" to ensure that a test object is always created even if it's a no op.
-        return [(None, None)] + [
-            (strip_path_prefix(k), v.strip()) for k, v in dag_bag.import_errors.items()
-        ]
+    # prepend "(None,None)" to ensure that a test object is always created even if it's a no op.
+    return [(None, None)] + [
+        (strip_path_prefix(k), v.strip()) for k, v in dag_bag.import_errors.items()
+    ]
 
 
 def get_dags():
     """
     Generate a tuple of dag_id, <DAG objects> in the DagBag
     """
-    with suppress_logging("airflow"):
-        dag_bag = DagBag(include_examples=False)
+    dag_bag = get_dag_bag()
 
     def strip_path_prefix(path):
         return os.path.relpath(path, os.environ.get("AIRFLOW_HOME"))
@@ -47,8 +55,14 @@ def get_dags():
     return [(k, v, strip_path_prefix(v.fileloc)) for k, v in dag_bag.dags.items()]
 
 
+# Computed once at collection time: each parametrize line would otherwise
+# re-run the helper (and with it a full DagBag parse) twice
+_IMPORT_ERRORS = get_import_errors()
+_DAGS = get_dags()
+
+
 @pytest.mark.parametrize(
-    "rel_path,rv", get_import_errors(), ids=[x[0] for x in get_import_errors()]
+    "rel_path,rv", _IMPORT_ERRORS, ids=[x[0] for x in _IMPORT_ERRORS]
 )
 def test_file_imports(rel_path, rv):
     """Test for import errors on a file"""
@@ -59,9 +73,7 @@ def test_file_imports(rel_path, rv):
 APPROVED_TAGS = {}
 
 
-@pytest.mark.parametrize(
-    "dag_id,dag,fileloc", get_dags(), ids=[x[2] for x in get_dags()]
-)
+@pytest.mark.parametrize("dag_id,dag,fileloc", _DAGS, ids=[x[2] for x in _DAGS])
 def test_dag_tags(dag_id, dag, fileloc):
     """
     test if a DAG is tagged and if those TAGs are in the approved list
@@ -71,9 +83,7 @@ def test_dag_tags(dag_id, dag, fileloc):
         assert not set(dag.tags) - APPROVED_TAGS
 
 
-@pytest.mark.parametrize(
-    "dag_id,dag, fileloc", get_dags(), ids=[x[2] for x in get_dags()]
-)
+@pytest.mark.parametrize("dag_id,dag, fileloc", _DAGS, ids=[x[2] for x in _DAGS])
 def test_dag_retries(dag_id, dag, fileloc):
     """
     test if a DAG has retries set
@@ -9,8 +9,8 @@ Tests use pytest and mock dependencies to simulate API responses.
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -20,7 +20,7 @@ from include.extractors.api.CoinGecko import CoinGeckoCoinsList
 class TestCoinGeckoCoinsList:
     """Test suite for the CoinGeckoCoinsList extractor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_api_response(self) -> Dict[str, Any]:
         """
         Fixture providing a sample API response.
@@ -37,7 +37,7 @@ class TestCoinGeckoCoinsList:
             ]
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_params(self) -> Dict[str, Any]:
         """
         Fixture providing mock query parameters.
@@ -49,18 +49,34 @@ class TestCoinGeckoCoinsList:
         """
         return {"some_param": "test_value"}
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def load_to_folder(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """
+        Fixture providing the output directory for the extractor.
+
+        Returns
+        -------
+        Path
+            A module-scoped temporary directory.
+        """
+        return tmp_path_factory.mktemp("coingecko")
+
+    @pytest.fixture(scope="module")
     def extractor(
-        self, mock_params: Dict[str, Any], tmp_path: Path
+        self, mock_params: Dict[str, Any], load_to_folder: Path
     ) -> CoinGeckoCoinsList:
         """
         Fixture providing an instance of CoinGeckoCoinsList.
 
+        Module-scoped: the instance is immutable for these tests, so one
+        construction is shared instead of rebuilding it (and its session
+        plumbing) per test.
+
         Parameters
         ----------
         mock_params : dict
             Query parameters for API requests.
-        tmp_path : Path
+        load_to_folder : Path
             Temporary directory for storing output files.
 
         Returns
@@ -68,7 +84,12 @@ class TestCoinGeckoCoinsList:
         CoinGeckoCoinsList
             An initialized instance of the extractor.
         """
-        return CoinGeckoCoinsList(params_query=mock_params, load_to=tmp_path)
+        extractor = CoinGeckoCoinsList(params_query=mock_params, load_to=load_to_folder)
+        # The instance is shared across tests, so disable client-side
+        # throttling: one test's request stamp would otherwise make the
+        # next test really sleep out the minimum request interval
+        extractor._min_request_interval = 0.0
+        return extractor
 
     def test_get_data(
         self, mocker, extractor: CoinGeckoCoinsList, mock_api_response: Dict[str, Any]
@@ -91,17 +112,49 @@ class TestCoinGeckoCoinsList:
         mocker.patch.object(extractor, "_open_session")
         mocker.patch.object(extractor, "_close_session")
 
+        # SimpleNamespace instead of MagicMock for the response: plain
+        # attribute access, no child-mock creation on every lookup
         mock_session = mocker.MagicMock()
-        mock_session.get.return_value = MagicMock(
-            status_code=200, json=lambda: mock_api_response
+        mock_session.get.return_value = SimpleNamespace(
+            status_code=200,
+            content=json.dumps(mock_api_response).encode("utf-8"),
+            raise_for_status=lambda: None,
         )
 
-        extractor._session = mock_session
+        mocker.patch.object(extractor, "_session", mock_session, create=True)
         response = extractor._get_data()
 
         assert response == mock_api_response, "API response should match mock data."
         mock_session.get.assert_called_once()
 
+    def test_stream_items(self, mocker, extractor: CoinGeckoCoinsList) -> None:
+        """
+        Test `_stream_items()` to ensure it parses items incrementally.
+
+        This test mocks a streamed response body and verifies that the
+        top-level array items are yielded one by one.
+
+        Parameters
+        ----------
+        mocker : pytest_mock.MockerFixture
+            Pytest mocker for patching dependencies.
+        extractor : CoinGeckoCoinsList
+            The extractor instance under test.
+        """
+        body = b'[{"id": "bitcoin"}, {"id": "ethereum"}]'
+
+        mock_response = mocker.MagicMock()
+        mock_response.iter_bytes.return_value = iter([body[:10], body[10:]])
+
+        mock_session = mocker.MagicMock()
+        mock_session.stream.return_value.__enter__.return_value = mock_response
+
+        mocker.patch.object(extractor, "_session", mock_session, create=True)
+        items = list(extractor._stream_items())
+
+        assert items == [{"id": "bitcoin"}, {"id": "ethereum"}]
+        mock_response.raise_for_status.assert_called_once()
+
     def test_is_last_page(
         self, extractor: CoinGeckoCoinsList, mock_api_response: Dict[str, Any]
     ) -> None:
@@ -144,35 +197,59 @@ class TestCoinGeckoCoinsList:
 
     def test_load_data(
         self,
+        mocker,
         extractor: CoinGeckoCoinsList,
         mock_api_response: Dict[str, Any],
-        tmp_path: Path,
+        load_to_folder: Path,
     ) -> None:
         """
         Test `_load_data()` method to verify correct data storage.
 
-        This test ensures that `_load_data()` saves the API response correctly
-        in the specified output directory.
+        The output file is mocked and the serializer is intercepted, so
+        the test compares the Python object handed to orjson.dumps
+        directly against the input — no encode/decode round-trip. The
+        output location is probed through `_output_path` directly rather
+        than scanning the directory, so no `iterdir` walk is needed and
+        debris from other tests cannot interfere.
 
         Parameters
         ----------
+        mocker : pytest_mock.MockerFixture
+            Pytest mocker for patching dependencies.
         extractor : CoinGeckoCoinsList
             The extractor instance under test.
         mock_api_response : dict
             The mocked API response.
-        tmp_path : Path
-            Temporary directory for storing output files.
+        load_to_folder : Path
+            The directory the extractor writes into.
         """
-        extractor._load_data(mock_api_response, tmp_path, page=1)
+        mock_file = mocker.mock_open()
+        mocker.patch("include.extractors.api_base.open", mock_file)
 
-        # Verify file creation
-        saved_files = list(tmp_path.iterdir())
-        assert len(saved_files) == 1, "One file should be created."
+        captured: Dict[str, Any] = {}
+        mocker.patch(
+            "include.extractors.api_base.orjson.dumps",
+            side_effect=lambda obj: (captured.setdefault("obj", obj), b"{}")[1],
+        )
 
-        file_path = saved_files[0]
+        extractor._open_output()
+        try:
+            extractor._load_data(mock_api_response, page=1)
+        finally:
+            extractor._close_output()
 
-        # Verify file content
-        with open(file_path, "r", encoding="utf-8") as f:
-            saved_data = json.load(f)
+        assert extractor._output_path is not None
+        assert (
+            extractor._output_path.parent == load_to_folder
+        ), "Output should land in the configured folder."
+        assert extractor._output_path.name.startswith(
+            extractor._file_stem
+        ), "Output name should start with the extractor's file stem."
+        assert extractor._output_path.name.endswith(
+            ".jsonl.zst"
+        ), "Output should be a zstd-compressed JSON-Lines file."
+        assert mock_file().write.called, "Serialized page should be written."
 
-        assert saved_data == mock_api_response, "Saved data should match API response."
+        assert (
+            captured["obj"] == mock_api_response
+        ), "Saved data should match API response."
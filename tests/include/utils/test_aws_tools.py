@@ -1,95 +1,115 @@
-import tempfile
+from io import BytesIO
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Any, Generator
 
-import boto3
 import pytest
-from moto import mock_aws
 
-from include.utils.aws_tools import S3Client
+if TYPE_CHECKING:
+    from include.utils.aws_tools import S3Client
 
 
-@pytest.fixture
-def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
-    """
-    Mock AWS credentials for testing.
-
-    This fixture sets environment variables to provide dummy AWS credentials.
-    """
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
-    monkeypatch.setenv("AWS_REGION", "us-east-1")
-
-
-@pytest.fixture
-def s3_mock(aws_credentials: None) -> Generator[boto3.client, None, None]:
-    """
-    Start and stop the moto AWS mock for S3.
-
-    Yields
-    ------
-    boto3.client
-        Mocked S3 client.
-    """
-    with mock_aws():
-        yield boto3.client("s3", region_name="us-east-1")
-
-
-@pytest.fixture
-def s3_client(s3_mock: boto3.client, monkeypatch: pytest.MonkeyPatch) -> S3Client:
+@pytest.fixture(scope="module")
+def s3_client(s3_mock: Any) -> "S3Client":
     """
     Create an instance of S3Client using the mocked S3 service.
 
+    Module-scoped: client construction pays the boto3 endpoint-resolver
+    and credential-chain cost, so one instance is shared across the test
+    class and isolation comes from the bucket sweep below.
+
     Parameters
     ----------
     s3_mock : boto3.client
         Mocked S3 client fixture.
-    monkeypatch : pytest.MonkeyPatch
-        Fixture for modifying environment variables.
 
     Returns
     -------
     S3Client
         Instance of S3Client for testing.
     """
+    from include.utils.aws_tools import S3Client
+
     bucket_name: str = "test-bucket"
     s3_mock.create_bucket(Bucket=bucket_name)
 
-    # Ensure the S3Client doesn't use any real AWS endpoint
-    monkeypatch.delenv("AWS_S3_ENDPOINT", raising=False)
-
     return S3Client(s3_bucket=bucket_name)
 
 
+@pytest.fixture(autouse=True)
+def clean_bucket(s3_client: "S3Client") -> Generator[None, None, None]:
+    """
+    Delete every key in the shared test bucket after each test.
+
+    Keeps tests isolated without re-entering the moto mock or rebuilding
+    the bucket per test.
+    """
+    yield
+    paginator = s3_client.s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=s3_client.s3_bucket):
+        contents = page.get("Contents", [])
+        if contents:
+            s3_client.s3.delete_objects(
+                Bucket=s3_client.s3_bucket,
+                Delete={"Objects": [{"Key": obj["Key"]} for obj in contents]},
+            )
+
+
 class TestS3Client:
     """Test suite for the S3Client class."""
 
-    def test_upload_file(self, s3_client: S3Client) -> None:
+    def test_upload_file(self, s3_client: "S3Client", tmp_path: Path) -> None:
         """
         Test uploading a file to S3.
 
         Ensures that the file is correctly uploaded and can be retrieved.
         """
+        upload_path = tmp_path / "upload.bin"
+        upload_path.write_bytes(b"test data")
 
-        # Ensure the bucket exists in the mocked S3 service
-        s3_client.s3.create_bucket(Bucket=s3_client.s3_bucket)
+        assert s3_client.upload_file(upload_path, "test-folder") is True
 
-        # Create a temporary file with test data
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(b"test data")
-            temp_file.close()
+        # Verify file exists in S3 using the correct S3 client instance
+        s3_key: str = f"test-folder/{upload_path.name}"
+        response = s3_client.s3.get_object(Bucket=s3_client.s3_bucket, Key=s3_key)
+        assert response["Body"].read() == b"test data"
 
-            # Upload file to S3
-            assert s3_client.upload_file(temp_file.name, "test-folder") is True
+    def test_upload_fileobj(self, s3_client: "S3Client") -> None:
+        """
+        Test uploading an in-memory stream to S3.
 
-            # Extract only the filename (not the full path)
-            s3_key: str = f"test-folder/{Path(temp_file.name).name}"
+        Ensures the stream is uploaded without a local file round-trip.
+        """
+        data = BytesIO(b"test data")
 
-            # Verify file exists in S3 using the correct S3 client instance
-            response = s3_client.s3.get_object(Bucket=s3_client.s3_bucket, Key=s3_key)
-            assert response["Body"].read() == b"test data"
+        assert s3_client.upload_fileobj(data, "test-folder", "stream.bin") is True
+
+        response = s3_client.s3.get_object(
+            Bucket=s3_client.s3_bucket, Key="test-folder/stream.bin"
+        )
+        assert response["Body"].read() == b"test data"
 
-    def test_download_file(self, s3_client: S3Client) -> None:
+    def test_upload_many(self, s3_client: "S3Client", tmp_path: Path) -> None:
+        """
+        Test uploading several files to S3 concurrently.
+
+        Ensures every file lands under the destination folder and one
+        result is returned per input file.
+        """
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"file{index}.txt"
+            path.write_bytes(f"data{index}".encode())
+            paths.append(path)
+
+        assert s3_client.upload_many(paths, "test-folder") == [True, True, True]
+
+        for index in range(3):
+            response = s3_client.s3.get_object(
+                Bucket=s3_client.s3_bucket, Key=f"test-folder/file{index}.txt"
+            )
+            assert response["Body"].read() == f"data{index}".encode()
+
+    def test_download_file(self, s3_client: "S3Client") -> None:
         """
         Test downloading an existing file from S3.
 
@@ -104,45 +124,67 @@ class TestS3Client:
         assert file_content is not None
         assert file_content == b"test data"
 
-    def test_download_file_not_found(self, s3_client: S3Client) -> None:
+    def test_download_file_bytes(self, s3_client: "S3Client") -> None:
+        """
+        Test the ranged parallel download path.
+
+        Uses a small part size to force multiple ranged GETs and ensures
+        the reassembled content matches what was uploaded.
+        """
+        s3_key: str = "test-folder/ranged-file.bin"
+        content: bytes = b"0123456789" * 5
+        s3_client.s3.put_object(Bucket=s3_client.s3_bucket, Key=s3_key, Body=content)
+
+        assert s3_client.download_file_bytes(s3_key, part_size=16) == content
+
+    def test_download_file_not_found(self, s3_client: "S3Client") -> None:
         """
         Test downloading a non-existing file from S3.
 
         Ensures None is returned when trying to download a missing file.
+        Only the error handling is under test, so the client is stubbed
+        instead of going through moto.
         """
-        assert s3_client.download_file("non-existent-file.txt") is None
-
-    def test_list_objects(self, s3_client: S3Client) -> None:
+        from botocore.stub import Stubber
+
+        with Stubber(s3_client.s3) as stubber:
+            stubber.add_client_error("get_object", service_error_code="NoSuchKey")
+
+            assert s3_client.download_file("non-existent-file.txt") is None
+
+    @pytest.mark.parametrize(
+        "keys,expected",
+        [
+            (["test-folder/file1.txt", "test-folder/file2.txt"], 2),
+            ([], 0),
+        ],
+        ids=["with-objects", "empty-prefix"],
+    )
+    def test_list_objects(
+        self, s3_client: "S3Client", keys: list[str], expected: int
+    ) -> None:
         """
         Test listing objects in S3 with a specific prefix.
 
-        Ensures the correct number of objects are returned under a given prefix.
+        Parametrized over the listing payload: ensures the correct number
+        of objects are returned, including the empty-prefix case.
         """
         prefix: str = "test-folder/"
-        s3_client.s3.put_object(
-            Bucket=s3_client.s3_bucket, Key=f"{prefix}file1.txt", Body=b"data1"
-        )
-        s3_client.s3.put_object(
-            Bucket=s3_client.s3_bucket, Key=f"{prefix}file2.txt", Body=b"data2"
-        )
+        for key in keys:
+            s3_client.s3.put_object(Bucket=s3_client.s3_bucket, Key=key, Body=b"data")
 
         objects = s3_client.list_objects(prefix)
-        assert len(objects) == 2
-        assert objects[0]["Key"].startswith(prefix)
+        assert len(objects) == expected
+        for obj in objects:
+            assert obj["Key"].startswith(prefix)
 
-    def test_list_objects_no_results(self, s3_client: S3Client) -> None:
-        """
-        Test listing objects in S3 when no files match the prefix.
-
-        Ensures an empty list is returned when no objects exist under the prefix.
-        """
-        assert s3_client.list_objects("empty-folder/") == []
-
-    def test_s3_client_initialization(self, s3_client: S3Client) -> None:
+    def test_s3_client_initialization(self, s3_client: "S3Client") -> None:
         """
         Test S3Client initialization.
 
         Ensures the S3 client is initialized correctly with the expected attributes.
         """
+        from include.utils.aws_tools import S3Client
+
         assert isinstance(s3_client, S3Client)
         assert s3_client.s3_bucket == "test-bucket"
@@ -0,0 +1,29 @@
+"""
+Test suite for env_tools.py
+
+This module contains unit tests for env_tools.py using pytest.
+"""
+
+import pytest
+
+from include.utils.env_tools import require_env_vars
+
+
+def test_require_env_vars_returns_mapping() -> None:
+    """
+    Test require_env_vars with all values present.
+
+    Ensures the mapping is returned unchanged when nothing is missing.
+    """
+    required = {"aws_access_key_id": "test", "aws_default_region": "us-east-1"}
+    assert require_env_vars(required) == required
+
+
+def test_require_env_vars_missing_value_exits() -> None:
+    """
+    Test require_env_vars with a missing value.
+
+    Ensures the process exits when a required variable is empty.
+    """
+    with pytest.raises(SystemExit):
+        require_env_vars({"aws_access_key_id": ""})
@@ -7,59 +7,107 @@ Each function is tested for expected behavior, ensuring correctness and robustne
 """
 
 import os
+import stat
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from include.utils.file_tools import (
     create_temp_folder,
     delete_temp_folder,
     list_temp_folder,
+    make_storage_prefix,
+    storage_path,
+)
+
+_FILENAMES: list[str] = ["test1.txt", "test2.log", "data.csv"]
+
+_STORAGE_CASES: tuple[tuple[str, str, str, str], ...] = (
+    ("Bronze", "CoinGecko", "coins_list", "Bronze/CoinGecko/coins_list"),
+    ("Silver", "CoinGecko", "coins_markets", "Silver/CoinGecko/coins_markets"),
 )
 
 
-class TestFileTools:
-    """Test suite for file_tools module."""
-
-    def test_create_temp_folder(self) -> None:
-        """
-        Test create_temp_folder function.
-
-        Ensures that a temporary directory is created and is accessible.
-        """
-        temp_folder: TemporaryDirectory = create_temp_folder("test")
-        assert os.path.exists(temp_folder.name), "Temporary directory should exist."
-        delete_temp_folder(temp_folder)
-
-    def test_delete_temp_folder(self) -> None:
-        """
-        Test delete_temp_folder function.
-
-        Ensures that the temporary directory is properly deleted.
-        """
-        temp_folder: TemporaryDirectory = create_temp_folder("delete_test")
-        temp_path: str = temp_folder.name
-        delete_temp_folder(temp_folder)
-        assert not os.path.exists(temp_path), "Temporary directory should be removed."
-
-    def test_list_temp_folder_empty(self, tmp_path: Path) -> None:
-        """
-        Test list_temp_folder function on an empty directory.
-
-        Ensures that listing an empty directory returns an empty list.
-        """
-        assert list_temp_folder(tmp_path) == [], "List should be empty for new folder."
-
-    def test_list_temp_folder_with_files(self, tmp_path: Path) -> None:
-        """
-        Test list_temp_folder function when files exist.
-
-        Ensures that listing a directory with files returns the correct file names.
-        """
-        filenames: list[str] = ["test1.txt", "test2.log", "data.csv"]
-        for filename in filenames:
-            (tmp_path / filename).write_text("test content")
-
-        listed_files: list[str] = list_temp_folder(tmp_path)
-        assert sorted(listed_files) == sorted(
-            filenames
-        ), "List should match created files."
+@pytest.fixture(scope="module")
+def populated_folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Fixture providing a folder prebuilt with sample files.
+
+    Module-scoped so the create/write/close syscalls per file are paid
+    once instead of on every test that lists the folder.
+
+    Returns
+    -------
+    Path
+        A temporary directory containing the sample files.
+    """
+    folder = tmp_path_factory.mktemp("files")
+    for filename in _FILENAMES:
+        # touch(): only names are asserted on, so skip the write syscall
+        (folder / filename).touch()
+    return folder
+
+
+def test_temp_folder_lifecycle() -> None:
+    """
+    Test create_temp_folder and delete_temp_folder together.
+
+    One mkdtemp/rmtree round-trip covers both halves of the
+    lifecycle instead of each test paying its own, and each existence
+    check is a single stat call: os.stat result reused for the
+    directory assertion, FileNotFoundError for the post-delete probe.
+    """
+    temp_folder: TemporaryDirectory = create_temp_folder("test")
+    temp_path: str = temp_folder.name
+    st = os.stat(temp_path)
+    assert stat.S_ISDIR(st.st_mode), "Temporary directory should exist."
+    delete_temp_folder(temp_folder)
+    with pytest.raises(FileNotFoundError):
+        os.stat(temp_path)
+
+
+def test_list_temp_folder_empty(tmp_path: Path) -> None:
+    """
+    Test list_temp_folder function on an empty directory.
+
+    Ensures that listing an empty directory yields nothing.
+    """
+    assert (
+        list(list_temp_folder(tmp_path)) == []
+    ), "List should be empty for new folder."
+
+
+def test_list_temp_folder_with_files(populated_folder: Path) -> None:
+    """
+    Test list_temp_folder function when files exist.
+
+    Ensures that listing a directory with files returns the correct file names.
+    """
+    assert set(list_temp_folder(populated_folder)) == set(
+        _FILENAMES
+    ), "List should match created files."
+
+
+@pytest.mark.parametrize("layer,source_name,source_surname,expected", _STORAGE_CASES)
+def test_storage_path(
+    layer: str, source_name: str, source_surname: str, expected: str
+) -> None:
+    """
+    Test storage_path function.
+
+    Ensures the storage key joins layer, source and surname correctly.
+    """
+    assert storage_path(layer, source_name, source_surname) == expected
+
+
+def test_make_storage_prefix() -> None:
+    """
+    Test make_storage_prefix function.
+
+    Ensures the pre-bound prefix builds the same keys as storage_path.
+    """
+    to_key = make_storage_prefix("Bronze", "CoinGecko")
+    assert to_key("coins_list") == storage_path(
+        "Bronze", "CoinGecko", "coins_list"
+    ), "Prefixed key should match storage_path output."
@@ -0,0 +1,27 @@
+"""
+Test suite for log_tools.py
+
+This module contains unit tests for log_tools.py using pytest.
+"""
+
+from io import StringIO
+
+from include.utils.log_tools import logger
+
+
+def test_logger_emits_deferred_format_messages() -> None:
+    """
+    Test the shared logger with deferred argument formatting.
+
+    Ensures arguments passed separately to the log call are interpolated
+    into the record and reach the sink.
+    """
+    buffer = StringIO()
+    sink_id = logger.add(buffer, level="INFO", enqueue=True)
+    try:
+        logger.info("File uploaded successfully: {}", "test-folder/file.txt")
+        logger.complete()  # Flush the background queue before reading capture
+    finally:
+        logger.remove(sink_id)
+
+    assert "File uploaded successfully: test-folder/file.txt" in buffer.getvalue()